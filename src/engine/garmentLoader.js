@@ -12,17 +12,21 @@ export function makeGLTFLoader() {
   return loader;
 }
 
+// shared across loads so the Draco decoder + worker pool are set up once
+let drapedLoader = null;
+
 /**
  * Try to fetch a precomputed draped mesh GLB.
  * url can be absolute, or like `/draped/tshirt_M.glb` (served from /public).
  * Returns a THREE.Group (the GLB's scene) or null if 404.
  */
 export async function loadDrapedGarment(url) {
-  const head = await fetch(url, { method: 'HEAD', cache: 'no-store' }).catch(() => null);
-  if (!head || !head.ok) return null;
+  // one GET: status is the existence check, body is parsed as-is (no HEAD + reload)
+  const res = await fetch(url).catch(() => null);
+  if (!res || !res.ok) return null;
 
-  const loader = makeGLTFLoader();
-  const gltf = await loader.loadAsync(url);
+  const loader = (drapedLoader ??= makeGLTFLoader());
+  const gltf = await loader.parseAsync(await res.arrayBuffer(), THREE.LoaderUtils.extractUrlBase(url));
   const root = gltf.scene || gltf.scenes?.[0];
 
   // basic setup
@@ -77,52 +77,64 @@ export function createTShirt({
   return group;
 }
 
+// Tube/sleeve topology depends only on the segment counts, so the index is built once
+// per (seg, rings) and shared by every rebuild. Grids here stay well under 65536 verts.
+const gridIndexCache = new Map();
+function gridIndex(seg, rings) {
+  const key = `${seg}x${rings}`;
+  let idx = gridIndexCache.get(key);
+  if (idx) return idx;
+  idx = new Uint16Array(seg * rings * 6);
+  let k = 0;
+  for (let y = 0; y < rings; y++) {
+    for (let i = 0; i < seg; i++) {
+      const a = y*(seg+1)+i, b = a + seg + 1;
+      idx[k++] = a; idx[k++] = b; idx[k++] = a+1;
+      idx[k++] = b; idx[k++] = b+1; idx[k++] = a+1;
+    }
+  }
+  gridIndexCache.set(key, idx);
+  return idx;
+}
+
 function makeBodyTube(chestR, waistR, h) {
   const seg = 64, rings = 40;
-  const pos = [], uvs = [], idx = [];
+  const nVerts = (rings + 1) * (seg + 1);
+  const pos = new Float32Array(nVerts * 3), uvs = new Float32Array(nVerts * 2);
+  let p = 0, q = 0;
   for (let y = 0; y <= rings; y++) {
     const t = y / rings, r = THREE.MathUtils.lerp(chestR, waistR, t), yPos = (t - 0.5) * h;
     for (let i = 0; i <= seg; i++) {
       const a = (i / seg) * Math.PI * 2;
-      pos.push(Math.cos(a)*r, yPos, Math.sin(a)*r);
-      uvs.push(i/seg, 1 - t);
-    }
-  }
-  for (let y = 0; y < rings; y++) {
-    for (let i = 0; i < seg; i++) {
-      const a = y*(seg+1)+i, b = a + seg + 1;
-      idx.push(a,b,a+1, b,b+1,a+1);
+      pos[p++] = Math.cos(a)*r; pos[p++] = yPos; pos[p++] = Math.sin(a)*r;
+      uvs[q++] = i/seg; uvs[q++] = 1 - t;
     }
   }
   const g = new THREE.BufferGeometry();
-  g.setIndex(idx);
-  g.setAttribute('position', new THREE.Float32BufferAttribute(pos,3));
-  g.setAttribute('uv',       new THREE.Float32BufferAttribute(uvs,2));
+  g.setIndex(new THREE.BufferAttribute(gridIndex(seg, rings), 1));
+  g.setAttribute('position', new THREE.BufferAttribute(pos,3));
+  g.setAttribute('uv',       new THREE.BufferAttribute(uvs,2));
   g.computeVertexNormals();
   return g;
 }
 
 function makeSleeve(r, len) {
   const radial = 32, height = 8;
-  const pos = [], uvs = [], idx = [];
+  const nVerts = (height + 1) * (radial + 1);
+  const pos = new Float32Array(nVerts * 3), uvs = new Float32Array(nVerts * 2);
+  let p = 0, q = 0;
   for (let y = 0; y <= height; y++) {
     const t = y / height; const radius = r * (1 - 0.05 * t); const xPos = (t - 0.1) * len;
     for (let i = 0; i <= radial; i++) {
       const a = (i / radial) * Math.PI * 2;
-      pos.push(xPos, Math.cos(a)*radius, Math.sin(a)*radius);
-      uvs.push(i / radial, 1 - t);
-    }
-  }
-  for (let y = 0; y < height; y++) {
-    for (let i = 0; i < radial; i++) {
-      const a = y * (radial + 1) + i; const b = a + radial + 1;
-      idx.push(a, b, a + 1, b, b + 1, a + 1);
+      pos[p++] = xPos; pos[p++] = Math.cos(a)*radius; pos[p++] = Math.sin(a)*radius;
+      uvs[q++] = i / radial; uvs[q++] = 1 - t;
     }
   }
   const g = new THREE.BufferGeometry();
-  g.setIndex(idx);
-  g.setAttribute('position', new THREE.Float32BufferAttribute(pos, 3));
-  g.setAttribute('uv',       new THREE.Float32BufferAttribute(uvs, 2));
+  g.setIndex(new THREE.BufferAttribute(gridIndex(radial, height), 1));
+  g.setAttribute('position', new THREE.BufferAttribute(pos, 3));
+  g.setAttribute('uv',       new THREE.BufferAttribute(uvs, 2));
   g.computeVertexNormals();
   return g;
 }
@@ -249,8 +249,9 @@ function stitchWrappedSeams(frontShape, backShape, { chestCirc, waistCirc, thick
 
   const halfW = Math.max(Math.abs(fBox.min.x), Math.abs(fBox.max.x));
 
-  // helper to wrap a 2D (x,y) to cylinder at a given angular sector
-  const wrapPoint = (x, y, sector /* 'front' | 'back' */) => {
+  // helper to wrap a 2D (x,y) to cylinder at a given angular sector.
+  // Writes into `out` (callers read it before the next call) to avoid a Vector3 per seam point.
+  const wrapPoint = (x, y, sector /* 'front' | 'back' */, out) => {
     const t = THREE.MathUtils.clamp((x / halfW + 1) / 2, 0, 1);
     const angle = sector === 'front'
       ? THREE.MathUtils.lerp(-Math.PI/2, +Math.PI/2, t)
@@ -262,8 +263,9 @@ function stitchWrappedSeams(frontShape, backShape, { chestCirc, waistCirc, thick
 
     const cos = Math.cos(angle), sin = Math.sin(angle);
     // two sides of thickness if ever needed; for seam we just need the outer shell
-    return new THREE.Vector3(cos * (r + thickness * 0.5), y, sin * (r + thickness * 0.5));
+    return out.set(cos * (r + thickness * 0.5), y, sin * (r + thickness * 0.5));
   };
+  const tmpV = new THREE.Vector3();
 
   const N = Math.min(FR.length, BK.length);
   for (let i = 0; i < N; i++) {
@@ -272,12 +274,11 @@ function stitchWrappedSeams(frontShape, backShape, { chestCirc, waistCirc, thick
 
     if (neckBand(pF.y) || hemBand(pF.y)) continue;
 
-    const vF = wrapPoint(pF.x, pF.y, 'front');
-    const vB = wrapPoint(pB.x, pB.y, 'back');
-
     const base = positions.length / 3;
     // order: front(i), back(i)
+    const vF = wrapPoint(pF.x, pF.y, 'front', tmpV);
     positions.push(vF.x, vF.y, vF.z);
+    const vB = wrapPoint(pB.x, pB.y, 'back', tmpV);
     positions.push(vB.x, vB.y, vB.z);
 
     uvs.push(i / (N - 1), 0);
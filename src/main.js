@@ -202,10 +202,10 @@ function estimateAvatarMeasures(root) {
 
   // Sample points by cloning, applying clipping-by-Y, and measuring XZ extents.
   // Cheap approach: just use full box XZ as chest/waist proxy, scaled.
-  const chestCirc = (full.getSize(new THREE.Vector3()).x * Math.PI) * 0.90 * 100; // cm-ish
+  const chestCirc = (size.x * Math.PI) * 0.90 * 100; // cm-ish
   const waistCirc = chestCirc * 0.92; // crude proportion fallback
 
-  const shoulders = full.getSize(new THREE.Vector3()).x * 0.9 * 100; // cm-ish
+  const shoulders = size.x * 0.9 * 100; // cm-ish
   const torsoY = (minY + (maxY - minY) * 0.25); // where shirt top sits visually
 
   return {